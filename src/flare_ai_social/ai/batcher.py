@@ -0,0 +1,145 @@
+"""
+Generation Batcher Module
+
+This module implements an asyncio micro-batcher for Gemini content generation.
+Requests arriving within a short window are collected from a queue and
+dispatched together, while a semaphore caps the number of generations in
+flight against the Gemini API.
+"""
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+from typing import Protocol
+
+import structlog
+
+from flare_ai_social.ai.base import ModelResponse
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncContentGenerator(Protocol):
+    """Protocol for providers that can generate content asynchronously"""
+
+    async def generate_content_async(self, prompt: str) -> ModelResponse: ...
+
+
+@dataclass
+class _PendingGeneration:
+    """A queued prompt and the future its caller is awaiting"""
+
+    provider: AsyncContentGenerator
+    prompt: str
+    future: asyncio.Future[ModelResponse]
+
+
+class GenerationBatcher:
+    """
+    Coalesce concurrent generation requests into batches.
+
+    A single background task drains the queue, gathering up to `max_batch_size`
+    requests that arrive within `window` seconds of the first one, and fires
+    the batch concurrently without waiting for it before collecting the next.
+
+    Attributes:
+        window (float): Seconds to wait for more requests after the first
+        max_batch_size (int): Maximum number of requests per batch
+    """
+
+    def __init__(
+        self, max_concurrency: int, window: float = 0.02, max_batch_size: int = 16
+    ) -> None:
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queue: asyncio.Queue[_PendingGeneration] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def generate(
+        self, provider: AsyncContentGenerator, prompt: str
+    ) -> ModelResponse:
+        """
+        Queue a prompt for generation and wait for its response.
+
+        Args:
+            provider (AsyncContentGenerator): Provider to generate the response with
+            prompt (str): Input prompt for content generation
+
+        Returns:
+            ModelResponse: Generated content from the provider
+        """
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future: asyncio.Future[ModelResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+        await self._queue.put(_PendingGeneration(provider, prompt, future))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Stop the background worker and wait for in-flight batches.
+
+        Requests that were queued or still being collected into a batch are
+        cancelled, so their callers are released instead of waiting forever.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        while not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """Collect queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        batch: list[_PendingGeneration] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.window
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), remaining)
+                        )
+                    except TimeoutError:
+                        break
+
+                logger.debug("dispatching_generation_batch", size=len(batch))
+                task = asyncio.create_task(self._dispatch(batch))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Release callers whose requests were collected but never dispatched
+            for pending in batch:
+                pending.future.cancel()
+            raise
+
+    async def _dispatch(self, batch: list[_PendingGeneration]) -> None:
+        """Generate responses for a batch concurrently."""
+        await asyncio.gather(*(self._generate(pending) for pending in batch))
+
+    async def _generate(self, pending: _PendingGeneration) -> None:
+        """Generate a single response and resolve its future."""
+        if pending.future.done():
+            return
+        try:
+            async with self._semaphore:
+                response = await pending.provider.generate_content_async(pending.prompt)
+        except Exception as e:  # noqa: BLE001
+            if not pending.future.done():
+                pending.future.set_exception(e)
+        else:
+            if not pending.future.done():
+                pending.future.set_result(response)
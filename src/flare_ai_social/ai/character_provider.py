@@ -1,6 +1,7 @@
-import json
-import os
 from pathlib import Path
+from typing import ClassVar
+
+import orjson
 import structlog
 
 from flare_ai_social.ai.gemini import GeminiProvider
@@ -11,6 +12,14 @@ class CharacterProvider(GeminiProvider):
     """Provider for character-based AI interactions"""
 
     CHARACTERS_FILE = Path("src/characters/characters.json")
+
+    # Parsed characters file shared by all instances, keyed on its mtime
+    _cache: ClassVar[dict | None] = None
+    _cache_mtime: ClassVar[float] = 0.0
+    # Lowercased character name -> character entry, rebuilt with the cache
+    _by_name: ClassVar[dict[str, dict]] = {}
+    # Display names in file order, served by list_available_characters
+    _names: ClassVar[list[str]] = []
     
     def __init__(self, api_key: str, character_name: str, model_name: str = "gemini-1.5-flash"):
         """
@@ -29,6 +38,7 @@ class CharacterProvider(GeminiProvider):
             raise ValueError(f"Character '{character_name}' not found")
             
         system_instruction = character_data.get("character_detail", {}).get("text", "")
+        self.system_instruction = system_instruction
         
         super().__init__(
             api_key=api_key,
@@ -36,7 +46,8 @@ class CharacterProvider(GeminiProvider):
             system_instruction=system_instruction
         )
         
-        logger.info("Character provider initialized", character=character_name)
+        self.logger = self.logger.bind(character=character_name)
+        self.logger.info("Character provider initialized")
 
     def _load_character(self, character_name: str) -> dict:
         """
@@ -48,20 +59,9 @@ class CharacterProvider(GeminiProvider):
         Returns:
             Character data dictionary or None if not found
         """
-        if not os.path.exists(self.CHARACTERS_FILE):
-            logger.error("Characters file not found", path=self.CHARACTERS_FILE)
-            raise FileNotFoundError(f"Characters file not found: {self.CHARACTERS_FILE}")
-            
         try:
-            with open(self.CHARACTERS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                
-            characters = data.get("characters", [])
-            for character in characters:
-                if character.get("character_name").lower() == character_name.lower():
-                    return character
-                    
-            return {}
+            self._load_characters_file()
+            return self._by_name.get(character_name.lower(), {})
             
         except Exception as e:
             logger.error("Failed to load character", error=str(e))
@@ -69,14 +69,27 @@ class CharacterProvider(GeminiProvider):
     
     @classmethod
     def _load_characters_file(cls) -> dict:
-        """Load the characters file"""
-        if not os.path.exists(cls.CHARACTERS_FILE):
-            logger.error("Characters file not found", path=cls.CHARACTERS_FILE)
-            raise FileNotFoundError(f"Characters file not found: {cls.CHARACTERS_FILE}")
-            
+        """Load the characters file, reusing the parsed data until it changes on disk"""
         try:
-            with open(cls.CHARACTERS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            mtime = cls.CHARACTERS_FILE.stat().st_mtime
+            if cls._cache is not None and mtime == cls._cache_mtime:
+                return cls._cache
+
+            # orjson parses UTF-8 bytes directly, skipping a separate text decode
+            data = orjson.loads(cls.CHARACTERS_FILE.read_bytes())
+
+            cls._by_name = {
+                character["character_name"].lower(): character
+                for character in data.get("characters", [])
+                if character.get("character_name")
+            }
+            cls._names = [character["character_name"] for character in cls._by_name.values()]
+            cls._cache = data
+            cls._cache_mtime = mtime
+            return data
+        except FileNotFoundError:
+            logger.error("Characters file not found", path=cls.CHARACTERS_FILE)
+            raise
         except Exception as e:
             logger.error("Failed to load characters file", error=str(e))
             raise
@@ -85,9 +98,8 @@ class CharacterProvider(GeminiProvider):
     def list_available_characters(cls) -> list:
         """Return list of available character names from the characters file"""
         try:
-            data = cls._load_characters_file()
-            characters = data.get("characters", [])
-            return [character.get("character_name") for character in characters if character.get("character_name")]
+            cls._load_characters_file()
+            return list(cls._names)
         except Exception as e:
             logger.error("Failed to list available characters", error=str(e))
             return []
\ No newline at end of file
@@ -6,12 +6,14 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
-from typing import TYPE_CHECKING, Any, override
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
 import google.generativeai as genai
 import structlog
 
 from flare_ai_social.ai.base import BaseAIProvider, ModelResponse
+from flare_ai_social.settings import settings
 
 if TYPE_CHECKING:
     from google.generativeai.types import ContentDict
@@ -34,6 +36,14 @@ class GeminiProvider(BaseAIProvider):
         logger (BoundLogger): Structured logger for the provider
     """
 
+    # Configured models shared by every provider with the same model name and
+    # system instruction, so per-session providers don't rebuild them. Least
+    # recently used models are evicted past character_cache_size, so edited
+    # or evicted personas don't keep their models alive
+    _models: ClassVar[OrderedDict[tuple[str, str | None], genai.GenerativeModel]] = (
+        OrderedDict()
+    )
+
     def __init__(
         self, api_key: str, model_name: str, system_instruction: str | None = None
     ) -> None:
@@ -48,10 +58,19 @@ class GeminiProvider(BaseAIProvider):
         """
         genai.configure(api_key=api_key)
         self.chat: genai.ChatSession | None = None
-        self.model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=system_instruction,
-        )
+        key = (model_name, system_instruction)
+        model = self._models.get(key)
+        if model is None:
+            model = genai.GenerativeModel(
+                model_name=model_name,
+                system_instruction=system_instruction,
+            )
+            self._models[key] = model
+            if len(self._models) > settings.character_cache_size:
+                self._models.popitem(last=False)
+        else:
+            self._models.move_to_end(key)
+        self.model = model
         self.chat_history: list[ContentDict] = []
         self.logger = logger.bind(service="gemini")
         self.logger.info(
@@ -109,6 +128,41 @@ class GeminiProvider(BaseAIProvider):
             },
         )
 
+    async def generate_content_async(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> ModelResponse:
+        """
+        Generate content using the Gemini model without blocking the event loop.
+
+        Asynchronous counterpart of `generate_content`, backed by the SDK's
+        native async client so concurrent requests can overlap their network IO.
+
+        Args:
+            prompt (str): Input prompt for content generation
+            response_mime_type (str | None): Expected MIME type for the response
+            response_schema (Any | None): Schema defining the response structure
+
+        Returns:
+            ModelResponse: Generated content with metadata, as in `generate_content`
+        """
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                response_mime_type=response_mime_type, response_schema=response_schema
+            ),
+        )
+        return ModelResponse(
+            text=response.text,
+            raw_response=response,
+            metadata={
+                "candidate_count": len(response.candidates),
+                "prompt_feedback": response.prompt_feedback,
+            },
+        )
+
     @override
     def send_message(
         self,
@@ -0,0 +1,156 @@
+"""
+Semantic Response Cache Module
+
+This module implements an embedding-based response cache placed in front of
+the Gemini API. Prompts are embedded once, compared by cosine similarity
+against previously answered prompts for the same character, and a stored
+response is returned when the match is close enough to reuse.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import google.generativeai as genai
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _CharacterEntries:
+    """Unit-normalized prompt embeddings and their responses for one character"""
+
+    instruction: str
+    embeddings: np.ndarray
+    responses: list[str] = field(default_factory=list)
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache of model responses, partitioned per character.
+
+    Each character keeps a matrix of unit-normalized prompt embeddings so a
+    lookup is a single matrix-vector product. Entries are evicted least
+    recently used first once a character exceeds `max_entries`, and whole
+    characters are evicted the same way past `max_characters`. A character's
+    entries are dropped when its system instruction changes, so edits to the
+    characters file never serve replies written for the old persona.
+
+    Attributes:
+        embedding_model (str): Gemini embedding model used for prompts
+        threshold (float): Minimum cosine similarity for a cache hit
+        max_entries (int): Maximum cached responses per character
+        max_characters (int): Maximum number of characters with cached responses
+    """
+
+    def __init__(
+        self,
+        embedding_model: str,
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        max_characters: int = 64,
+    ) -> None:
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_characters = max_characters
+        self._entries: OrderedDict[str, _CharacterEntries] = OrderedDict()
+
+    async def embed(self, prompt: str) -> np.ndarray:
+        """
+        Embed a prompt with the configured Gemini embedding model.
+
+        Args:
+            prompt (str): Prompt text to embed
+
+        Returns:
+            np.ndarray: Unit-normalized embedding vector
+
+        Raises:
+            ValueError: If the embedding is zero or contains non-finite values
+        """
+        result = await genai.embed_content_async(
+            model=self.embedding_model,
+            content=prompt,
+            task_type="semantic_similarity",
+        )
+        embedding = np.asarray(result["embedding"], dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if not np.isfinite(norm) or norm == 0:
+            msg = "Embedding must be finite and non-zero"
+            raise ValueError(msg)
+        return embedding / norm
+
+    def lookup(
+        self, character: str, instruction: str, embedding: np.ndarray
+    ) -> str | None:
+        """
+        Return the cached response for the most similar prompt, if any.
+
+        Args:
+            character (str): Character the prompt was sent to
+            instruction (str): System instruction the character currently uses
+            embedding (np.ndarray): Unit-normalized prompt embedding
+
+        Returns:
+            str | None: Cached response text, or None on a cache miss
+        """
+        entries = self._entries.get(character)
+        if entries is None:
+            return None
+        if entries.instruction != instruction:
+            del self._entries[character]
+            return None
+        self._entries.move_to_end(character)
+
+        similarities = entries.embeddings @ embedding
+        # argmax would pick a NaN row over every finite one, so rank those last
+        best = int(np.argmax(np.where(np.isnan(similarities), -np.inf, similarities)))
+        # Negated so a NaN similarity is treated as a miss
+        if not similarities[best] >= self.threshold:
+            return None
+
+        logger.debug(
+            "semantic_cache_hit",
+            character=character,
+            similarity=float(similarities[best]),
+        )
+        # Move the hit to the end so eviction drops the least recently used rows
+        response = entries.responses.pop(best)
+        entries.responses.append(response)
+        entries.embeddings = np.vstack(
+            [np.delete(entries.embeddings, best, axis=0), entries.embeddings[best]]
+        )
+        return response
+
+    def store(
+        self, character: str, instruction: str, embedding: np.ndarray, response: str
+    ) -> None:
+        """
+        Cache a response for a prompt embedding.
+
+        Args:
+            character (str): Character the prompt was sent to
+            instruction (str): System instruction the response was generated with
+            embedding (np.ndarray): Unit-normalized prompt embedding
+            response (str): Response text to cache
+        """
+        entries = self._entries.get(character)
+        if entries is None or entries.instruction != instruction:
+            self._entries.pop(character, None)
+            self._entries[character] = _CharacterEntries(
+                instruction=instruction,
+                embeddings=embedding[np.newaxis, :],
+                responses=[response],
+            )
+            if len(self._entries) > self.max_characters:
+                self._entries.popitem(last=False)
+            return
+
+        self._entries.move_to_end(character)
+        entries.embeddings = np.vstack([entries.embeddings, embedding])
+        entries.responses.append(response)
+        if len(entries.responses) > self.max_entries:
+            entries.embeddings = entries.embeddings[1:]
+            entries.responses.pop(0)
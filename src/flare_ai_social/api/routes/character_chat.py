@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from collections import OrderedDict
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel, Field
+import orjson
 import structlog
 
 
 
+from flare_ai_social.ai.batcher import GenerationBatcher
 from flare_ai_social.ai.character_provider import CharacterProvider
+from flare_ai_social.ai.semantic_cache import SemanticCache
 from flare_ai_social.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -14,6 +20,11 @@ class CharacterRequest(BaseModel):
     character: str = Field(..., description="Character name to chat with")
     message: str = Field(..., description="Message to send to the character")
 
+    @property
+    def character_key(self) -> str:
+        """Normalized character name used for lookups and cache keys"""
+        return self.character.strip().lower()
+
 
 class CharacterResponse(BaseModel):
     """Response model for character chat"""
@@ -32,47 +43,130 @@ class CharacterChatRouter:
     def __init__(self):
         """Initialize with character providers"""
         self.router = APIRouter()
-        self.providers: dict[str, CharacterProvider] = {}
+        self.logger = logger.bind(router="character_chat")
+        # Least recently used providers are evicted past character_cache_size
+        self.providers: OrderedDict[str, CharacterProvider] = OrderedDict()
+        # In-flight provider constructions, keyed like providers
+        self._pending: dict[str, asyncio.Task[CharacterProvider]] = {}
+        self.batcher = GenerationBatcher(
+            max_concurrency=settings.gemini_max_concurrency,
+            window=settings.gemini_batch_window,
+            max_batch_size=settings.gemini_batch_size,
+        )
+        self.response_cache: SemanticCache | None = None
+        if settings.semantic_cache_enabled:
+            self.response_cache = SemanticCache(
+                embedding_model=settings.semantic_cache_embedding_model,
+                threshold=settings.semantic_cache_threshold,
+                max_entries=settings.semantic_cache_size,
+                max_characters=settings.character_cache_size,
+            )
         
         # Register routes
         self.router.add_api_route(
-            "/chat", self.chat_endpoint, methods=["POST"], response_model=CharacterResponse
+            "/chat",
+            self.chat_endpoint,
+            methods=["POST"],
+            # Responses are pre-serialized, the model only documents the schema
+            responses={200: {"model": CharacterResponse}},
         )
         self.router.add_api_route(
             "/characters", self.list_characters, methods=["GET"], response_model=CharacterListResponse
         )
 
-    async def chat_endpoint(self, request: CharacterRequest) -> dict:
+    async def chat_endpoint(self, request: CharacterRequest) -> Response:
         """Process chat message and return character response"""
-        character = request.character.lower()
+        character = request.character_key
         message = request.message
         
         # Get or create provider for this character
-        if character not in self.providers:
+        provider = await self._get_provider(character, request.character)
+        
+        # Serve near-duplicate prompts from the semantic cache
+        embedding = None
+        if self.response_cache is not None:
             try:
-                self.providers[character] = CharacterProvider(
-                    api_key=settings.gemini_api_key,
-                    character_name=request.character,
-                    model_name="gemini-1.5-flash",
-                )
-            except ValueError as e:
-                logger.error("Character not found", character=character, error=str(e))
-                raise HTTPException(status_code=404, detail=f"Character '{request.character}' not found")
+                embedding = await self.response_cache.embed(message)
             except Exception as e:
-                logger.error("Failed to initialize character provider", error=str(e))
-                raise HTTPException(status_code=500, detail=f"Failed to initialize character: {str(e)}")
+                self.logger.warning("Failed to embed message", character=character, error=str(e))
+            else:
+                cached = self.response_cache.lookup(
+                    character, provider.system_instruction, embedding
+                )
+                if cached is not None:
+                    return self._chat_response(request.character, cached)
         
         # Generate response
         try:
-            response = self.providers[character].generate_content(message)
-            return {
-                "character": request.character,
-                "response": response.text
-            }
+            response = await self.batcher.generate(provider, message)
+            if embedding is not None and self.response_cache is not None:
+                self.response_cache.store(
+                    character, provider.system_instruction, embedding, response.text
+                )
+            return self._chat_response(request.character, response.text)
         except Exception as e:
-            logger.error("Failed to generate response", character=character, error=str(e))
+            self.logger.error("Failed to generate response", character=character, error=str(e))
             raise HTTPException(status_code=500, detail=f"Failed to generate response: {str(e)}")
     
-    async def list_characters(self) -> dict:
+    @staticmethod
+    def _chat_response(character: str, text: str) -> Response:
+        """Serialize a chat reply directly, bypassing response model validation"""
+        return Response(
+            content=orjson.dumps({"character": character, "response": text}),
+            media_type="application/json",
+        )
+
+    async def _get_provider(self, character: str, character_name: str) -> CharacterProvider:
+        """Return the cached provider for a character, creating it on first use"""
+        provider = self.providers.get(character)
+        if provider is not None:
+            self.providers.move_to_end(character)
+            return provider
+
+        # Concurrent first requests for a character share one construction and
+        # its outcome, so a failing character is not rebuilt by every waiter
+        pending = self._pending.get(character)
+        if pending is None:
+            pending = asyncio.create_task(self._create_provider(character))
+            self._pending[character] = pending
+            pending.add_done_callback(
+                lambda task: self._discard_pending(character, task)
+            )
+
+        try:
+            # Shielded so one disconnecting client doesn't cancel it for the rest
+            return await asyncio.shield(pending)
+        except ValueError as e:
+            self.logger.error("Character not found", character=character, error=str(e))
+            raise HTTPException(status_code=404, detail=f"Character '{character_name}' not found")
+        except Exception as e:
+            self.logger.error("Failed to initialize character provider", character=character, error=str(e))
+            raise HTTPException(status_code=500, detail=f"Failed to initialize character: {str(e)}")
+
+    def _discard_pending(self, character: str, task: asyncio.Task) -> None:
+        """Forget a finished construction unless a newer one has replaced it"""
+        if self._pending.get(character) is task:
+            del self._pending[character]
+        # Mark the outcome retrieved in case every waiting client went away
+        if not task.cancelled():
+            task.exception()
+
+    async def _create_provider(self, character: str) -> CharacterProvider:
+        """Build a character provider and add it to the LRU cache"""
+        # File IO and SDK setup would otherwise stall the event loop
+        provider = await asyncio.to_thread(
+            CharacterProvider,
+            api_key=settings.gemini_api_key,
+            character_name=character,
+            model_name="gemini-1.5-flash",
+        )
+        self.providers[character] = provider
+        if len(self.providers) > settings.character_cache_size:
+            self.providers.popitem(last=False)
+        return provider
+
+    async def list_characters(self, response: Response) -> dict:
         """List available characters"""
+        # The catalogue rarely changes, let clients and proxies reuse it briefly
+        response.headers["Cache-Control"] = "public, max-age=60"
         return {"characters": CharacterProvider.list_available_characters()}
\ No newline at end of file
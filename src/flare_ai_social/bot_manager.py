@@ -1,6 +1,5 @@
 import asyncio
 import contextlib
-import threading
 
 import google.generativeai as genai
 import structlog
@@ -18,6 +17,10 @@ logger = structlog.get_logger(__name__)
 # Error messages
 ERR_AI_PROVIDER_NOT_INITIALIZED = "AI provider must be initialized"
 
+# Seconds to wait before restarting a crashed Twitter bot, doubled for every
+# consecutive crash up to the polling interval
+TWITTER_RESTART_DELAY = 5.0
+
 
 class BotManager:
     """Manager class for handling multiple social media bots."""
@@ -25,10 +28,14 @@ class BotManager:
     def __init__(self) -> None:
         """Initialize the BotManager."""
         self.ai_provider: BaseAIProvider | None = None
-        self.twitter_thread: threading.Thread | None = None
+        self.twitter_task: asyncio.Task | None = None
         self.active_bots: list[str] = []
         self.running = False
         self._telegram_polling_task: asyncio.Task | None = None
+        # Set when the Twitter task finishes, wakes monitor_bots
+        self._twitter_exit = asyncio.Event()
+        self._twitter_started_at = 0.0
+        self._twitter_restart_delay = TWITTER_RESTART_DELAY
 
     def initialize_ai_provider(self) -> None:
         """Initialize the AI provider with either tuned model or default model."""
@@ -107,7 +114,7 @@ class BotManager:
         return self.ai_provider
 
     def start_twitter_bot(self) -> bool:
-        """Initialize and start the Twitter bot in a separate thread."""
+        """Initialize and start the Twitter bot as a task on the running loop."""
         if not settings.enable_twitter:
             logger.info("Twitter bot disabled in settings")
             return False
@@ -146,11 +153,12 @@ class BotManager:
                 config=config,
             )
 
-            self.twitter_thread = threading.Thread(
-                target=twitter_bot.start, daemon=True, name="TwitterBotThread"
+            self.twitter_task = asyncio.create_task(
+                twitter_bot.run(), name="TwitterBotTask"
             )
-            self.twitter_thread.start()
-            logger.info("Twitter bot started in background thread")
+            self.twitter_task.add_done_callback(lambda _: self._twitter_exit.set())
+            self._twitter_started_at = asyncio.get_running_loop().time()
+            logger.info("Twitter bot started in background task")
             self.active_bots.append("Twitter")
 
         except ValueError:
@@ -162,43 +170,47 @@ class BotManager:
         else:
             return True
 
-    def _parse_allowed_users(self) -> list[int]:
-        """Parse the allowed users from settings."""
-        allowed_users: list[int] = []
-        if settings.telegram_allowed_users:
-            try:
-                allowed_users = [
-                    int(user_id.strip())
-                    for user_id in settings.telegram_allowed_users.split(",")
-                    if user_id.strip().isdigit()
-                ]
-            except ValueError:
-                logger.warning("Error parsing telegram_allowed_users")
-        return allowed_users
-
-    def _check_twitter_status(self) -> None:
+    async def _check_twitter_status(self) -> None:
         """Check and handle Twitter bot status."""
-        if self.twitter_thread and not self.twitter_thread.is_alive():
-            logger.error("Twitter bot thread terminated unexpectedly")
+        if self.twitter_task and self.twitter_task.done():
+            error = (
+                None if self.twitter_task.cancelled() else self.twitter_task.exception()
+            )
+            logger.error("Twitter bot task terminated unexpectedly", error=str(error))
             self.active_bots.remove("Twitter")
-            if self.start_twitter_bot():
+            await self._wait_before_twitter_restart()
+            if self.running and self.start_twitter_bot():
                 logger.info("Twitter bot restarted successfully")
 
+    async def _wait_before_twitter_restart(self) -> None:
+        """Back off before a restart so a bot that crashes on startup can't spin."""
+        max_delay = max(float(settings.twitter_polling_interval), TWITTER_RESTART_DELAY)
+        uptime = asyncio.get_running_loop().time() - self._twitter_started_at
+        # A run that outlasted the longest backoff was healthy, start over
+        if uptime >= max_delay:
+            self._twitter_restart_delay = TWITTER_RESTART_DELAY
+
+        delay = self._twitter_restart_delay
+        self._twitter_restart_delay = min(delay * 2, max_delay)
+        logger.info("Restarting Twitter bot after delay", delay=delay)
+        await asyncio.sleep(delay)
+
     async def monitor_bots(self) -> None:
         """Monitor active bots and handle unexpected terminations."""
         self.running = True
 
         try:
             while self.running and self.active_bots:
+                await self._twitter_exit.wait()
+                self._twitter_exit.clear()
+
                 if "Twitter" in self.active_bots:
-                    self._check_twitter_status()
+                    await self._check_twitter_status()
 
                 if not self.active_bots:
                     logger.error("No active bots remaining")
                     break
 
-                await asyncio.sleep(5)
-
         except Exception:
             logger.exception("Error in bot monitoring loop")
         finally:
@@ -208,8 +220,11 @@ class BotManager:
         """Gracefully shutdown all active bots."""
         self.running = False
 
-        if "Twitter" in self.active_bots:
-            logger.info("Twitter bot daemon thread will terminate with main process")
+        if self.twitter_task and not self.twitter_task.done():
+            self.twitter_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.twitter_task
+            logger.info("Twitter bot task stopped")
 
         logger.info("All bots shutdown completed")
 
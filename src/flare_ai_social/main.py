@@ -12,6 +12,9 @@ Dependencies:
     - Custom providers for AI, blockchain, and attestation services
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import google.generativeai as genai
 import structlog
 from fastapi import FastAPI
@@ -26,7 +29,17 @@ genai.configure(api_key=settings.gemini_api_key)
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application instance."""
-    app = FastAPI(title="PromptPlay Character API", redirect_slashes=False)
+    character_chat = CharacterChatRouter()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        yield
+        # Stop the generation batcher's worker before the loop shuts down
+        await character_chat.batcher.close()
+
+    app = FastAPI(
+        title="PromptPlay Character API", redirect_slashes=False, lifespan=lifespan
+    )
 
     # Configure CORS middleware
     app.add_middleware(
@@ -38,7 +51,6 @@ def create_app() -> FastAPI:
     )
 
     # Add the character chat router
-    character_chat = CharacterChatRouter()
     app.include_router(character_chat.router, prefix="/api/characters", tags=["characters"])
 
     return app
@@ -28,6 +28,23 @@ class Settings(BaseSettings):
     # Learning rate
     tuning_learning_rate: float = 0.001
 
+    # Maximum number of character providers kept alive by the chat API
+    character_cache_size: int = 64
+    # Reuse responses for near-duplicate prompts instead of calling Gemini
+    semantic_cache_enabled: bool = False
+    # Embedding model used to compare prompts
+    semantic_cache_embedding_model: str = "models/text-embedding-004"
+    # Minimum cosine similarity for a prompt to reuse a cached response
+    semantic_cache_threshold: float = 0.92
+    # Maximum cached responses per character
+    semantic_cache_size: int = 256
+    # Maximum concurrent Gemini generations issued by the chat API
+    gemini_max_concurrency: int = 16
+    # Seconds to wait for more chat requests before dispatching a batch
+    gemini_batch_window: float = 0.02
+    # Maximum chat requests dispatched together in one batch
+    gemini_batch_size: int = 16
+
     # Twitter Bot settings
     enable_twitter: bool = True  # Enable Twitter bot
     # X/Twitter API credentials (all required for the TwitterBot to function)
@@ -16,8 +16,6 @@ import structlog
 from flare_ai_social.settings import settings
 
 logger = structlog.get_logger(__name__)
-genai.configure(api_key=settings.gemini_api_key)
-sns.set_style("darkgrid")
 
 
 class TrainingEntry(TypedDict):
@@ -136,6 +134,7 @@ def start() -> None:
     Raises:
         Exception: If model training fails
     """
+    genai.configure(api_key=settings.gemini_api_key)
     new_model_id = settings.tuned_model_name
     # Check if model already exists
     check_model_existence(new_model_id)
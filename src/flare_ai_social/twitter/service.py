@@ -480,7 +480,10 @@ class TwitterBot:
                 mention_text = f"@{mention.get('screen_name', '')}"
                 clean_text = clean_text.replace(mention_text, "").strip()
 
-            ai_response = self.ai_provider.generate_content(clean_text)
+            # Generation is blocking, keep it off the shared event loop
+            ai_response = await asyncio.to_thread(
+                self.ai_provider.generate_content, clean_text
+            )
             response_text = ai_response.text
 
             max_chars = 280
@@ -527,11 +530,15 @@ class TwitterBot:
                     logger.exception("Error in monitoring loop")
                     await asyncio.sleep(self.polling_interval * 2)
 
+    async def run(self) -> None:
+        """Run the monitoring process on the current event loop"""
+        logger.info("Starting Twitter monitoring bot")
+        await self.monitor_mentions()
+
     def start(self) -> None:
         """Start the monitoring process"""
-        logger.info("Starting Twitter monitoring bot")
         try:
-            asyncio.run(self.monitor_mentions())
+            asyncio.run(self.run())
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
         except Exception:
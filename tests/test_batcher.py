@@ -0,0 +1,165 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from flare_ai_social.ai.base import ModelResponse
+from flare_ai_social.ai.batcher import GenerationBatcher
+
+MAX_CONCURRENCY = 2
+REQUEST_COUNT = 6
+
+
+class FakeProvider:
+    """Provider stub recording prompts and the peak number of calls in flight"""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def generate_content_async(self, prompt: str) -> ModelResponse:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if prompt == "bad":
+            msg = "generation failed"
+            raise RuntimeError(msg)
+        return ModelResponse(text=f"echo:{prompt}", raw_response=None, metadata={})
+
+
+def record_batch_sizes(batcher: GenerationBatcher) -> list[int]:
+    """Wrap the batcher's dispatch to record the size of every batch"""
+    sizes: list[int] = []
+    dispatch = batcher._dispatch  # noqa: SLF001
+
+    async def recording_dispatch(batch: list[Any]) -> None:
+        sizes.append(len(batch))
+        await dispatch(batch)
+
+    batcher._dispatch = recording_dispatch  # noqa: SLF001
+    return sizes
+
+
+def test_requests_within_window_are_coalesced() -> None:
+    """Test that a burst inside the window is dispatched as one batch"""
+
+    async def run() -> tuple[list[str], list[int]]:
+        batcher = GenerationBatcher(max_concurrency=8, window=0.05)
+        sizes = record_batch_sizes(batcher)
+        provider = FakeProvider()
+        responses = await asyncio.gather(
+            *(batcher.generate(provider, f"hi{i}") for i in range(4))
+        )
+        await batcher.close()
+        return [response.text for response in responses], sizes
+
+    texts, sizes = asyncio.run(run())
+
+    assert texts == ["echo:hi0", "echo:hi1", "echo:hi2", "echo:hi3"]
+    assert sizes == [4]
+
+
+def test_max_batch_size_splits_burst() -> None:
+    """Test that a burst larger than max_batch_size is split"""
+
+    async def run() -> list[int]:
+        batcher = GenerationBatcher(max_concurrency=8, window=0.05, max_batch_size=2)
+        sizes = record_batch_sizes(batcher)
+        provider = FakeProvider()
+        await asyncio.gather(*(batcher.generate(provider, f"hi{i}") for i in range(5)))
+        await batcher.close()
+        return sizes
+
+    assert asyncio.run(run()) == [2, 2, 1]
+
+
+def test_semaphore_caps_in_flight_generations() -> None:
+    """Test that no more than max_concurrency generations run at once"""
+
+    async def run() -> FakeProvider:
+        batcher = GenerationBatcher(max_concurrency=MAX_CONCURRENCY, window=0.01)
+        provider = FakeProvider(delay=0.02)
+        await asyncio.gather(
+            *(batcher.generate(provider, f"hi{i}") for i in range(REQUEST_COUNT))
+        )
+        await batcher.close()
+        return provider
+
+    provider = asyncio.run(run())
+
+    assert len(provider.prompts) == REQUEST_COUNT
+    assert provider.peak_in_flight == MAX_CONCURRENCY
+
+
+def test_exception_reaches_only_its_caller() -> None:
+    """Test that a failed generation fails its own caller and no other"""
+
+    async def run() -> tuple[Any, ...]:
+        batcher = GenerationBatcher(max_concurrency=8, window=0.05)
+        provider = FakeProvider()
+        results = await asyncio.gather(
+            batcher.generate(provider, "good"),
+            batcher.generate(provider, "bad"),
+            return_exceptions=True,
+        )
+        await batcher.close()
+        return results
+
+    good, bad = asyncio.run(run())
+
+    assert isinstance(good, ModelResponse)
+    assert good.text == "echo:good"
+    assert isinstance(bad, RuntimeError)
+
+
+def test_cancelled_caller_is_skipped() -> None:
+    """Test that a caller cancelled before dispatch never hits the provider"""
+
+    async def run() -> tuple[FakeProvider, str]:
+        batcher = GenerationBatcher(max_concurrency=8, window=0.05)
+        provider = FakeProvider()
+        cancelled = asyncio.create_task(batcher.generate(provider, "gone"))
+        kept = asyncio.create_task(batcher.generate(provider, "kept"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        response = await kept
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        await batcher.close()
+        return provider, response.text
+
+    provider, text = asyncio.run(run())
+
+    assert text == "echo:kept"
+    assert provider.prompts == ["kept"]
+
+
+def test_close_cancels_undispatched_requests() -> None:
+    """Test that close releases callers whose requests were never dispatched"""
+
+    async def run() -> tuple[FakeProvider, list[Any]]:
+        batcher = GenerationBatcher(max_concurrency=8, window=1.0, max_batch_size=2)
+        provider = FakeProvider()
+        tasks = [
+            asyncio.create_task(batcher.generate(provider, f"hi{i}")) for i in range(3)
+        ]
+        # Let the worker collect the first request and start waiting for more
+        await asyncio.sleep(0.01)
+        await batcher.close()
+        results = await asyncio.wait_for(
+            asyncio.gather(*tasks, return_exceptions=True), timeout=0.5
+        )
+        return provider, results
+
+    provider, results = asyncio.run(run())
+
+    assert provider.prompts == ["hi0", "hi1"]
+    assert isinstance(results[0], ModelResponse)
+    assert isinstance(results[1], ModelResponse)
+    assert isinstance(results[2], asyncio.CancelledError)
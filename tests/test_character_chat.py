@@ -0,0 +1,123 @@
+import asyncio
+import time
+from typing import Any, ClassVar
+
+import orjson
+import pytest
+from fastapi import HTTPException, Response
+
+from flare_ai_social.ai.base import ModelResponse
+from flare_ai_social.api.routes import character_chat
+from flare_ai_social.api.routes.character_chat import (
+    CharacterChatRouter,
+    CharacterRequest,
+)
+from flare_ai_social.settings import settings
+
+REQUEST_COUNT = 5
+CACHE_SIZE = 2
+NOT_FOUND = 404
+
+
+class FakeCharacterProvider:
+    """CharacterProvider stub counting constructions per character"""
+
+    constructions: ClassVar[list[str]] = []
+
+    def __init__(self, api_key: str, character_name: str, model_name: str) -> None:
+        # Slow enough that concurrent cold requests overlap the construction
+        time.sleep(0.05)
+        type(self).constructions.append(character_name)
+        if character_name == "nobody":
+            msg = f"Character '{character_name}' not found"
+            raise ValueError(msg)
+        self.character_name = character_name
+        self.system_instruction = f"You are {character_name}."
+
+    async def generate_content_async(self, prompt: str) -> ModelResponse:
+        return ModelResponse(
+            text=f"{self.character_name}:{prompt}", raw_response=None, metadata={}
+        )
+
+
+@pytest.fixture
+def router(monkeypatch: pytest.MonkeyPatch) -> CharacterChatRouter:
+    """Fixture to provide a router that builds stub providers"""
+    monkeypatch.setattr(FakeCharacterProvider, "constructions", [])
+    monkeypatch.setattr(character_chat, "CharacterProvider", FakeCharacterProvider)
+    monkeypatch.setattr(settings, "semantic_cache_enabled", False)
+    monkeypatch.setattr(settings, "character_cache_size", CACHE_SIZE)
+    return CharacterChatRouter()
+
+
+async def chat(router: CharacterChatRouter, character: str) -> Any:
+    """Send a message through the endpoint and decode the reply"""
+    response = await router.chat_endpoint(
+        CharacterRequest(character=character, message="hello")
+    )
+    assert isinstance(response, Response)
+    return orjson.loads(response.body)
+
+
+def test_concurrent_cold_requests_build_one_provider(
+    router: CharacterChatRouter,
+) -> None:
+    """Test that simultaneous first requests share a single construction"""
+
+    async def run() -> list[Any]:
+        replies = await asyncio.gather(
+            *(chat(router, "DarkSanta") for _ in range(REQUEST_COUNT))
+        )
+        await router.batcher.close()
+        return replies
+
+    replies = asyncio.run(run())
+
+    assert FakeCharacterProvider.constructions == ["darksanta"]
+    assert all(
+        reply == {"character": "DarkSanta", "response": "darksanta:hello"}
+        for reply in replies
+    )
+
+
+def test_concurrent_unknown_character_builds_once(
+    router: CharacterChatRouter,
+) -> None:
+    """Test that a failing construction is shared and each caller gets a 404"""
+    names = [f"{' ' * i}NoBody" for i in range(REQUEST_COUNT)]
+
+    async def run() -> list[Any]:
+        return await asyncio.gather(
+            *(chat(router, name) for name in names), return_exceptions=True
+        )
+
+    errors = asyncio.run(run())
+
+    assert FakeCharacterProvider.constructions == ["nobody"]
+    for name, error in zip(names, errors, strict=True):
+        assert isinstance(error, HTTPException)
+        assert error.status_code == NOT_FOUND
+        assert error.detail == f"Character '{name}' not found"
+    # A failed construction is not cached, the next request tries again
+    assert router.providers == {}
+    assert router._pending == {}  # noqa: SLF001
+
+
+def test_providers_evict_least_recently_used(router: CharacterChatRouter) -> None:
+    """Test that providers past character_cache_size are evicted"""
+
+    async def run() -> None:
+        await chat(router, "darksanta")
+        await chat(router, "bluebatman")
+        await chat(router, "darksanta")
+        await chat(router, "cyberninja")
+        await router.batcher.close()
+
+    asyncio.run(run())
+
+    assert list(router.providers) == ["darksanta", "cyberninja"]
+    assert FakeCharacterProvider.constructions == [
+        "darksanta",
+        "bluebatman",
+        "cyberninja",
+    ]
@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+import orjson
+import pytest
+
+from flare_ai_social.ai.character_provider import CharacterProvider
+
+
+def write_characters(path: Path, names: list[str], mtime: float) -> None:
+    """Write a characters file with the given names and modification time"""
+    characters = [
+        {"character_name": name, "character_detail": {"text": f"You are {name}."}}
+        for name in names
+    ]
+    path.write_bytes(orjson.dumps({"characters": characters}))
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def characters_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture to point CharacterProvider at an empty-cache temporary file"""
+    path = tmp_path / "characters.json"
+    monkeypatch.setattr(CharacterProvider, "CHARACTERS_FILE", path)
+    monkeypatch.setattr(CharacterProvider, "_cache", None)
+    monkeypatch.setattr(CharacterProvider, "_cache_mtime", 0.0)
+    monkeypatch.setattr(CharacterProvider, "_by_name", {})
+    monkeypatch.setattr(CharacterProvider, "_names", [])
+    return path
+
+
+def test_unchanged_file_is_parsed_once(characters_file: Path) -> None:
+    """Test that the parsed file is reused while its mtime is unchanged"""
+    write_characters(characters_file, ["DarkSanta"], mtime=1_000)
+
+    first = CharacterProvider._load_characters_file()  # noqa: SLF001
+
+    assert CharacterProvider._load_characters_file() is first  # noqa: SLF001
+
+
+def test_modified_file_rebuilds_index(characters_file: Path) -> None:
+    """Test that a newer mtime reloads the file and rebuilds the name index"""
+    write_characters(characters_file, ["DarkSanta", "BlueBatman"], mtime=1_000)
+    assert CharacterProvider.list_available_characters() == ["DarkSanta", "BlueBatman"]
+
+    write_characters(characters_file, ["CyberNinja"], mtime=2_000)
+
+    assert CharacterProvider.list_available_characters() == ["CyberNinja"]
+    assert list(CharacterProvider._by_name) == ["cyberninja"]  # noqa: SLF001
+
+
+def test_missing_file_lists_no_characters(characters_file: Path) -> None:
+    """Test that a missing characters file lists no characters"""
+    assert CharacterProvider.list_available_characters() == []
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+
+import pytest
+
+from flare_ai_social.ai import GeminiProvider
+from flare_ai_social.settings import settings
+
+CACHE_SIZE = 2
+
+
+@pytest.fixture(autouse=True)
+def shared_models(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fixture to give each test an empty, small shared model map"""
+    monkeypatch.setattr(GeminiProvider, "_models", OrderedDict())
+    monkeypatch.setattr(settings, "character_cache_size", CACHE_SIZE)
+
+
+def test_providers_share_models() -> None:
+    """Test that providers with the same configuration reuse one model"""
+    first = GeminiProvider("key", "gemini-1.5-flash", "You are DarkSanta.")
+    second = GeminiProvider("key", "gemini-1.5-flash", "You are DarkSanta.")
+
+    assert second.model is first.model
+
+
+def test_shared_models_evict_least_recently_used() -> None:
+    """Test that models past character_cache_size are evicted"""
+    santa = GeminiProvider("key", "gemini-1.5-flash", "You are DarkSanta.")
+    GeminiProvider("key", "gemini-1.5-flash", "You are BlueBatman.")
+    GeminiProvider("key", "gemini-1.5-flash", "You are DarkSanta.")
+    GeminiProvider("key", "gemini-1.5-flash", "You are CyberNinja.")
+
+    assert list(GeminiProvider._models) == [  # noqa: SLF001
+        ("gemini-1.5-flash", "You are DarkSanta."),
+        ("gemini-1.5-flash", "You are CyberNinja."),
+    ]
+    assert GeminiProvider("key", "gemini-1.5-flash", "You are DarkSanta.").model is (
+        santa.model
+    )
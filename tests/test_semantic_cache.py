@@ -0,0 +1,98 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from flare_ai_social.ai.semantic_cache import SemanticCache
+
+PERSONA = "You are a festive but menacing Santa."
+
+
+def unit(*values: float) -> np.ndarray:
+    """Build a unit-normalized embedding"""
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def cache() -> SemanticCache:
+    """Fixture to provide a small semantic cache"""
+    return SemanticCache(
+        embedding_model="models/text-embedding-004",
+        threshold=0.9,
+        max_entries=2,
+        max_characters=2,
+    )
+
+
+def test_lookup_returns_similar_response(cache: SemanticCache) -> None:
+    """Test that a near-duplicate prompt reuses the cached response"""
+    cache.store("darksanta", PERSONA, unit(1, 0, 0), "ho ho ho")
+
+    assert cache.lookup("darksanta", PERSONA, unit(1, 0.1, 0)) == "ho ho ho"
+    assert cache.lookup("darksanta", PERSONA, unit(0, 1, 0)) is None
+
+
+def test_lookup_is_partitioned_per_character(cache: SemanticCache) -> None:
+    """Test that responses are not shared between characters"""
+    cache.store("darksanta", PERSONA, unit(1, 0, 0), "ho ho ho")
+
+    assert cache.lookup("bluebatman", PERSONA, unit(1, 0, 0)) is None
+
+
+def test_store_evicts_least_recently_used_entry(cache: SemanticCache) -> None:
+    """Test that hits are kept and the oldest unused entry is evicted"""
+    cache.store("darksanta", PERSONA, unit(1, 0, 0), "first")
+    cache.store("darksanta", PERSONA, unit(0, 1, 0), "second")
+    assert cache.lookup("darksanta", PERSONA, unit(1, 0, 0)) == "first"
+
+    cache.store("darksanta", PERSONA, unit(0, 0, 1), "third")
+
+    assert cache.lookup("darksanta", PERSONA, unit(1, 0, 0)) == "first"
+    assert cache.lookup("darksanta", PERSONA, unit(0, 1, 0)) is None
+    assert cache.lookup("darksanta", PERSONA, unit(0, 0, 1)) == "third"
+
+
+def test_store_evicts_least_recently_used_character(cache: SemanticCache) -> None:
+    """Test that characters beyond max_characters are evicted"""
+    cache.store("darksanta", PERSONA, unit(1, 0, 0), "ho ho ho")
+    cache.store("bluebatman", PERSONA, unit(1, 0, 0), "i am the night")
+    cache.store("cyberninja", PERSONA, unit(1, 0, 0), "swoosh")
+
+    assert cache.lookup("darksanta", PERSONA, unit(1, 0, 0)) is None
+    assert cache.lookup("cyberninja", PERSONA, unit(1, 0, 0)) == "swoosh"
+
+
+def test_lookup_ignores_non_finite_similarity(cache: SemanticCache) -> None:
+    """Test that a NaN row cannot turn unrelated prompts into hits"""
+    cache.store("darksanta", PERSONA, unit(1, 0, 0), "ho ho ho")
+    cache.store("darksanta", PERSONA, np.full(3, np.nan, dtype=np.float32), "poisoned")
+
+    assert cache.lookup("darksanta", PERSONA, unit(0, 1, 0)) is None
+    assert cache.lookup("darksanta", PERSONA, unit(1, 0, 0)) == "ho ho ho"
+
+
+@pytest.mark.parametrize("values", [[0.0, 0.0, 0.0], [1.0, np.nan, 0.0]])
+def test_embed_rejects_degenerate_embeddings(
+    cache: SemanticCache, monkeypatch: pytest.MonkeyPatch, values: list[float]
+) -> None:
+    """Test that zero or non-finite embeddings are rejected"""
+
+    async def fake_embed_content_async(**kwargs: str) -> dict[str, list[float]]:
+        return {"embedding": values}
+
+    monkeypatch.setattr(
+        "flare_ai_social.ai.semantic_cache.genai.embed_content_async",
+        fake_embed_content_async,
+    )
+
+    with pytest.raises(ValueError, match="finite and non-zero"):
+        asyncio.run(cache.embed("hello"))
+
+
+def test_instruction_change_clears_character(cache: SemanticCache) -> None:
+    """Test that replies written for an old system instruction are dropped"""
+    cache.store("darksanta", PERSONA, unit(1, 0, 0), "ho ho ho")
+
+    assert cache.lookup("darksanta", "You are a jolly Santa.", unit(1, 0, 0)) is None
+    assert cache.lookup("darksanta", PERSONA, unit(1, 0, 0)) is None